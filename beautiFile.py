@@ -1,17 +1,148 @@
+import time
+_T0 = time.perf_counter()
+
+# Set BEAUTIFILE_TIMINGS=1 to print a startup breakdown to stderr
+_timings = []
+
+
+def mark(label):
+    _timings.append((label, time.perf_counter()))
+
+
+import os
 import sys
 import json
-import subprocess
+import zlib
+mark("stdlib")
+
+from PySide6.QtCore import Qt, QSize, QFileInfo, QPropertyAnimation, QEasingCurve, QPoint, QEvent, QAbstractAnimation, QTimer
+mark("QtCore")
+from PySide6.QtGui import QCursor, QIcon, QImageReader, QPixmap, QPainter
+mark("QtGui")
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QFrame,
+    QApplication, QWidget, QFrame,
     QToolButton, QGridLayout, QFileIconProvider
 )
-from PySide6.QtGui import QCursor, QIcon
-from PySide6.QtCore import Qt, QSize, QFileInfo, QPropertyAnimation, QEasingCurve, QPoint, QEvent, QAbstractAnimation
+mark("QtWidgets")
+
+
+# Config lives next to the script, not the working directory
+CONFIG_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(sys.argv[0])), "beautFile_config.json"
+)
+
+# Rendered images of each group's last popup, painted before the live widgets exist
+SNAPSHOT_DIR = os.path.join(os.path.dirname(CONFIG_FILE), ".beautiFile_cache")
+# Bump when the popup layout/styling changes so old snapshots are ignored
+SNAPSHOT_VERSION = 1
+
+def report_timings():
+    if not os.environ.get("BEAUTIFILE_TIMINGS"):
+        return
+    prev = _T0
+    for label, t in _timings:
+        print(f"{label:>14}: {(t - prev) * 1000:7.1f} ms", file=sys.stderr)
+        prev = t
+    print(f"{'total':>14}: {(prev - _T0) * 1000:7.1f} ms", file=sys.stderr)
+
+
+def snapshot_path(group_name: str):
+    digest = zlib.crc32(group_name.encode("utf-8"))
+    return os.path.join(SNAPSHOT_DIR, f"{digest:08x}.png")
+
+
+def snapshot_key(group_name: str, apps, scale: float):
+    """Anything that changes how the popup looks must be part of this key."""
+    return json.dumps([SNAPSHOT_VERSION, group_name, apps, scale])
+
+
+def load_snapshot(group_name: str, apps, scale: float):
+    # The key sits in a text chunk ahead of the pixels, so check it before decoding
+    reader = QImageReader(snapshot_path(group_name))
+    if reader.text("key") != snapshot_key(group_name, apps, scale):
+        return None
+    image = reader.read()
+    if image.isNull():
+        return None
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(scale)
+    return pixmap
+
+
+def save_snapshot(group_name: str, apps, scale: float, pixmap: QPixmap):
+    image = pixmap.toImage()
+    image.setText("key", snapshot_key(group_name, apps, scale))
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        image.save(snapshot_path(group_name), "PNG")
+    except OSError:
+        # a missing snapshot only costs the fast first frame next time
+        pass
+
+
+def popup_position(width: int, height: int):
+    screen = QApplication.primaryScreen()
+    geom = screen.availableGeometry()
+
+    # Approximate desktop icon grid cell size (tweak these to match your setup)
+    cell_w = 100   # width of one desktop icon slot
+    cell_h = 102   # height of one desktop icon slot
+
+    cursor = QCursor.pos()
+
+    # Convert cursor pos to grid coordinates (relative to desktop top-left)
+    col = (cursor.x() - geom.left()) // cell_w
+    row = (cursor.y() - geom.top())  // cell_h
+
+    # Target cell: one cell to the right
+    target_col = col + 2
+
+    # Top-left of that target cell
+    target_x = geom.left() + target_col * cell_w
+    target_y = geom.top()  + row       * cell_h
+
+    # Center our window inside that cell
+    x = int(target_x + (cell_w - width) / 2)
+    y = int(target_y + (cell_h - height) / 2)
+
+    # Clamp to screen
+    x = max(geom.left(), min(x, geom.right() - width))
+    y = max(geom.top(),  min(y, geom.bottom() - height))
+
+    return QPoint(x, y)
+
+
+class SnapshotWindow(QWidget):
+    """Static stand-in for the popup, shown while the real widgets are built."""
+
+    def __init__(self, pixmap: QPixmap):
+        super().__init__()
+        self.pixmap = pixmap
+
+        self.setWindowFlags(
+            Qt.FramelessWindowHint |
+            Qt.Tool |
+            Qt.WindowStaysOnTopHint
+        )
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+
+        size = pixmap.deviceIndependentSize().toSize()
+        self.resize(size)
+        self.move(popup_position(size.width(), size.height()))
+
+    def paintEvent(self, event):
+        QPainter(self).drawPixmap(0, 0, self.pixmap)
 
 
 class MainWindow(QWidget) :
-    def __init__(self):
+    def __init__(self, group_name, apps, snapshot=None):
         super().__init__()
+        self.group_name = group_name
+        self.apps = apps
+        # When a snapshot is already on screen, appear in place instead of animating in
+        self.snapshot = snapshot
+        self._painted = False
         QApplication.instance().installEventFilter(self)
 
         self.setWindowFlags(
@@ -36,12 +167,16 @@ class MainWindow(QWidget) :
         self.createShortcuts(layout)
         self.resize(container.sizeHint())
         container.resize(self.size())
-        self.handlePosition()
+        if self.snapshot is not None:
+            # Land exactly on the snapshot rather than re-reading the cursor
+            self.move(self.snapshot.pos())
+        else:
+            self.handlePosition()
         self.createAnims()
         
     def createShortcuts(self, layout):
         icon_provider = QFileIconProvider()
-        for i, (name, path) in enumerate(APPS):
+        for i, (name, path) in enumerate(self.apps):
             btn = QToolButton()
             btn.setText(name)
 
@@ -56,35 +191,7 @@ class MainWindow(QWidget) :
             layout.addWidget(btn, 0, i)
     
     def handlePosition(self):
-        screen = QApplication.primaryScreen()
-        geom = screen.availableGeometry()
-
-        # Approximate desktop icon grid cell size (tweak these to match your setup)
-        cell_w = 100   # width of one desktop icon slot
-        cell_h = 102   # height of one desktop icon slot
-
-        cursor = QCursor.pos()
-
-        # Convert cursor pos to grid coordinates (relative to desktop top-left)
-        col = (cursor.x() - geom.left()) // cell_w
-        row = (cursor.y() - geom.top())  // cell_h
-
-        # Target cell: one cell to the right
-        target_col = col + 2
-
-        # Top-left of that target cell
-        target_x = geom.left() + target_col * cell_w
-        target_y = geom.top()  + row       * cell_h
-
-        # Center our window inside that cell
-        x = int(target_x + (cell_w - self.width()) / 2)
-        y = int(target_y + (cell_h - self.height()) / 2)
-
-        # Clamp to screen
-        x = max(geom.left(), min(x, geom.right() - self.width()))
-        y = max(geom.top(),  min(y, geom.bottom() - self.height()))
-
-        self.move(x, y)
+        self.move(popup_position(self.width(), self.height()))
 
     def createAnims(self):
         self.setWindowOpacity(0.0)
@@ -103,6 +210,9 @@ class MainWindow(QWidget) :
         self.pos_anim.setEasingCurve(QEasingCurve.OutCubic)
 
         self._closing = False
+        self._captured = False
+        # Capture once the intro has played so the disk write can't stutter it
+        self.opacity_anim.finished.connect(self.captureSnapshot)
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -111,15 +221,52 @@ class MainWindow(QWidget) :
         self.raise_()
         self.setFocus()
 
+        if self.snapshot is not None:
+            # Stay at opacity 0 behind the snapshot until the first frame is
+            # painted. A cached open skips the fade/slide, so it lands instantly
+            return
+
         # restart animations each time it shows
         self.opacity_anim.start()
         self.pos_anim.start()
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            mark("first paint")
+            report_timings()
+            if self.snapshot is not None:
+                # Swap once this frame is done, never showing both translucent layers
+                QTimer.singleShot(0, self.replaceSnapshot)
+
+    def replaceSnapshot(self):
+        if self.snapshot is None:
+            return
+        self.setWindowOpacity(1.0)
+        self.snapshot.close()
+        self.snapshot = None
+        self.captureSnapshot()
+
+    def captureSnapshot(self):
+        """Store this open's layout so the next one paints it straight away."""
+        # Skip a popup being dismissed: it may show a pressed button, and
+        # closing shouldn't pay for a PNG write
+        if self._captured or self._closing:
+            return
+        self._captured = True
+        save_snapshot(self.group_name, self.apps, self.devicePixelRatioF(), self.grab())
+
     def close_with_animation(self):
         if self._closing:
             return
         self._closing = True
 
+        if self.snapshot is not None:
+            # Closed before the swap; fade out the live window alone
+            self.snapshot.close()
+            self.snapshot = None
+
         self.opacity_anim.setDirection(QAbstractAnimation.Backward)
         self.pos_anim.setDirection(QAbstractAnimation.Backward)
 
@@ -140,6 +287,8 @@ class MainWindow(QWidget) :
         QApplication.quit()
     
     def shortCutClicked(self, path):
+        # Only needed once something is launched, keep it off the startup path
+        import subprocess
         subprocess.Popen(path)
         self.close_with_animation()
 
@@ -154,16 +303,32 @@ class MainWindow(QWidget) :
 
 
 def load_apps(group_name: str):
-    with open("beautFile_config.json", "r") as f:
+    with open(CONFIG_FILE, "r") as f:
         data = json.load(f)
     return data.get(group_name, [])
 
 
-if __name__ == "__main__":
+def main():
     group = sys.argv[1] if len(sys.argv) > 1 else "Games"
-    APPS = load_apps(group)
+    apps = load_apps(group)
+    mark("config")
 
     app = QApplication(sys.argv)
-    window = MainWindow()
+    mark("QApplication")
+
+    snapshot = None
+    pixmap = load_snapshot(group, apps, app.primaryScreen().devicePixelRatio())
+    if pixmap is not None:
+        snapshot = SnapshotWindow(pixmap)
+        snapshot.show()
+        app.processEvents()
+        mark("snapshot")
+
+    window = MainWindow(group, apps, snapshot)
+    mark("build window")
     window.show()
     app.exec()
+
+
+if __name__ == "__main__":
+    main()
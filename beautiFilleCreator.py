@@ -2,6 +2,7 @@ import os
 import sys
 import json
 import subprocess
+from collections import OrderedDict
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QFrame, QMessageBox, QPushButton,
@@ -9,10 +10,16 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QToolButton, QFileIconProvider, QGridLayout, QLineEdit
 )
 from PySide6.QtGui import QCursor, QIcon
-from PySide6.QtCore import Qt, QSize, QFileInfo, QPropertyAnimation, QEasingCurve, QPoint, QEvent, QAbstractAnimation
+from PySide6.QtCore import Qt, QSize, QFileInfo, QPropertyAnimation, QEasingCurve, QPoint, QEvent, QAbstractAnimation, QTimer
 
 
-CONFIG_FILE = "beautFile_config.json"
+# Same script-relative file the desktop popup reads, whatever the working directory
+CONFIG_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "beautFile_config.json"
+)
+
+# How many closed (hidden) group editors to keep around for quick reopening
+MAX_HIDDEN_GROUP_WINDOWS = 4
 
 
 class AppGroupWindow(QMainWindow):
@@ -110,6 +117,17 @@ class AppGroupWindow(QMainWindow):
         self.update_empty_state()
         self.refresh_icons()
 
+    def reload(self):
+        """Re-read this group from config so a reused editor shows current data."""
+        self.apps = self.creator.load_config().get(self.group_name, [])
+        self.update_empty_state()
+        self.refresh_icons()
+
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        # Closing only hides the editor; let the creator drop old ones once hidden
+        QTimer.singleShot(0, self.creator.prune_group_windows)
+
     def update_empty_state(self):
         if not self.apps:
             self.empty_label.setText("No files in app group!")
@@ -189,7 +207,8 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(container)
         self.setWindowTitle("BeautiFile")
 
-        self.group_windows = []
+        # group name -> AppGroupWindow, least recently used first
+        self.group_windows = OrderedDict()
 
         layout = QVBoxLayout(container)
         layout.setContentsMargins(16, 12, 16, 12)
@@ -425,9 +444,29 @@ class MainWindow(QMainWindow):
         self.open_group(group_name)
 
     def open_group(self, group_name: str):
-        editor = AppGroupWindow(self, group_name)
-        self.group_windows.append(editor)
+        editor = self.group_windows.get(group_name)
+        if editor is None:
+            editor = AppGroupWindow(self, group_name)
+            self.group_windows[group_name] = editor
+        else:
+            editor.reload()
+        self.group_windows.move_to_end(group_name)
+
         editor.show()
+        editor.raise_()
+        editor.activateWindow()
+
+        self.prune_group_windows()
+
+    def prune_group_windows(self):
+        """Dispose of the least recently used hidden editors beyond the cap."""
+        hidden = [
+            name for name, editor in self.group_windows.items()
+            if not editor.isVisible()
+        ]
+        for name in hidden[:max(0, len(hidden) - MAX_HIDDEN_GROUP_WINDOWS)]:
+            editor = self.group_windows.pop(name)
+            editor.deleteLater()
 
     def launch_group(self, group_name: str):
         """Launch a beautiFile window for the given group on the desktop."""